@@ -8,9 +8,11 @@ Consolidates common patterns like logging, rich formatting, command execution, e
 import os
 import sys
 import subprocess
+import tempfile
+import threading
 import importlib.util
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Union
 import shutil
 
 # Rich imports with fallback
@@ -41,6 +43,7 @@ class Logger:
     def __init__(self, name: str = "Script"):
         self.name = name
         self.errors = []
+        self._lock = threading.Lock()
     
     def info(self, message: str):
         """Log info message"""
@@ -62,7 +65,8 @@ class Logger:
             console.print(f"❌ {message}", style="red")
         else:
             print(f"[ERROR] {message}")
-        self.errors.append(message)
+        with self._lock:
+            self.errors.append(message)
     
     def verbose(self, message: str, enabled: bool = True):
         """Log verbose message"""
@@ -118,12 +122,39 @@ class CommandRunner:
             console.print(f"❌ {status_msg} [red]Failed[/red]")
         return success, output
 
+def replace_file_atomically(file_path: Path, data: bytes, durable: bool = False):
+    """Write data to a fresh temporary sibling and atomically swap it into place,
+    so readers never see a partial file. A symlink is written through to its
+    target, and an existing file keeps its permissions"""
+    target = Path(os.path.realpath(file_path))
+    try:
+        mode = target.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
 class FileManager:
     """Unified file operations with error handling"""
     
-    def __init__(self, logger: Logger, dry_run: bool = False):
+    def __init__(self, logger: Logger, dry_run: bool = False, durable: bool = False):
         self.logger = logger
         self.dry_run = dry_run
+        self.durable = durable
     
     def read_file(self, file_path: Path) -> Optional[str]:
         """Read file content with error handling"""
@@ -133,16 +164,31 @@ class FileManager:
             self.logger.error(f"Failed to read {file_path}: {e}")
             return None
     
-    def write_file(self, file_path: Path, content: str) -> bool:
-        """Write file content with error handling"""
+    def read_bytes(self, file_path: Path) -> Optional[bytes]:
+        """Read raw file content with error handling"""
+        try:
+            return file_path.read_bytes()
+        except Exception as e:
+            self.logger.error(f"Failed to read {file_path}: {e}")
+            return None
+    
+    def write_file(self, file_path: Path, content: Union[str, bytes]) -> bool:
+        """Write file content (text is encoded as UTF-8) with error handling"""
         if self.dry_run:
             self.logger.verbose(f"Would write {file_path}")
             return True
         
         try:
+            data = content if isinstance(content, bytes) else content.encode('utf-8')
+            
+            # Leave identical files untouched to preserve their mtime
+            if file_path.exists() and file_path.read_bytes() == data:
+                self.logger.verbose(f"Unchanged {file_path}")
+                return True
+            
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding='utf-8')
+            replace_file_atomically(file_path, data, self.durable)
             self.logger.verbose(f"Updated {file_path}")
             return True
         except Exception as e:
@@ -223,7 +269,7 @@ class RichHelper:
         return None
     
     @staticmethod
-    def create_table(title: str = "") -> Optional[Table]:
+    def create_table(title: str = "") -> Optional["Table"]:
         """Create a rich table if available"""
         if HAS_RICH:
             table = Table(title=title)
@@ -241,11 +287,32 @@ class RichHelper:
             print("=" * (len(title) + 8))
     
     @staticmethod
-    def print_table(table: Table):
+    def print_table(table: "Table"):
         """Print a rich table if available"""
         if HAS_RICH and table:
             console.print(table)
     
+    @staticmethod
+    def print_rows(title: str, columns: Dict[str, Dict[str, Any]], rows: List[Tuple[str, ...]]):
+        """Print rows as a rich table (columns map each header to its add_column
+        options), or as aligned plain text when rich is unavailable"""
+        if HAS_RICH:
+            table = Table(title=title)
+            for header, options in columns.items():
+                table.add_column(header, **options)
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
+        else:
+            headers = tuple(columns)
+            widths = [max(map(len, cells)) for cells in zip(headers, *rows)]
+            lines = [title] if title else []
+            lines.extend(
+                "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                for row in (headers, *rows)
+            )
+            print("\n".join(lines))
+    
     @staticmethod
     def status_context(message: str):
         """Create a status context manager"""
@@ -311,7 +378,7 @@ class ScriptBase:
         sys.exit(0)
 
 # Global convenience functions for backward compatibility
-def get_console() -> Optional[Console]:
+def get_console() -> Optional["Console"]:
     """Get rich console instance"""
     return console
 
@@ -319,6 +386,12 @@ def has_rich() -> bool:
     """Check if rich is available"""
     return HAS_RICH
 
+def disable_rich():
+    """Fall back to plain output even if rich is available"""
+    global HAS_RICH, console
+    HAS_RICH = False
+    console = None
+
 def has_requests() -> bool:
     """Check if requests is available"""
     return HAS_REQUESTS 
\ No newline at end of file
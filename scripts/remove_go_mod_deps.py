@@ -7,22 +7,38 @@ try:
 except ImportError:
     HAS_RICH = False
 
-print_pretty = Console().print if HAS_RICH else print
+if HAS_RICH:
+    _console = Console()
 
-def get_go_mod_deps():
+    def print_pretty(*objects, **kwargs):
+        # Module paths may contain '[' which Rich would parse as markup
+        _console.print(*objects, markup=False, highlight=False, **kwargs)
+else:
+    print_pretty = print
+
+def get_go_mod_deps(go_sum_path='go.sum'):
+    # Read dependencies from go.sum instead of `go list -m all`, which runs the
+    # module resolver and may hit the network. Entries ending in /go.mod only
+    # fetch the go.mod file, so they never have an extracted directory to remove.
     try:
-        output = subprocess.check_output(['go', 'list', '-m', 'all'], text=True)
-        deps = []
-        for line in output.strip().split('\n')[1:]:  # Skip the first line (the main module)
-            parts = line.split()
-            if len(parts) == 2:
-                module_path, version = parts
-                deps.append((module_path, version))
-        return deps
-    except subprocess.CalledProcessError as e:
-        print_pretty("Error getting module list:", e)
+        with open(go_sum_path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    except OSError as e:
+        print_pretty("Error reading go.sum:", e)
         return []
 
+    deps = []
+    seen = set()
+    for line in lines:
+        parts = line.split()
+        if len(parts) != 3 or parts[1].endswith('/go.mod'):
+            continue
+        dep = (parts[0], parts[1])
+        if dep not in seen:
+            seen.add(dep)
+            deps.append(dep)
+    return deps
+
 def get_gomodcache():
     try:
         output = subprocess.check_output(['go', 'env', 'GOMODCACHE'], text=True)
@@ -33,6 +49,8 @@ def get_gomodcache():
 
 def escape_module_path(module_path):
     # Convert the module path to directory-safe format (Go escapes some characters)
+    if os.sep == '/':
+        return module_path
     return module_path.replace('/', os.sep).replace('\\', os.sep)
 
 def remove_cached_modules(deps, gomodcache):
@@ -10,24 +10,20 @@ import sys
 import subprocess
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+VENV_PYTHON = PROJECT_ROOT / ".venv" / ("Scripts/python.exe" if os.name == 'nt' else "bin/python")
+
 def get_project_root() -> Path:
     """Get the project root directory"""
-    return Path(__file__).parent.parent
+    return PROJECT_ROOT
 
 def get_venv_python() -> Path:
     """Get the path to the virtual environment Python executable"""
-    project_root = get_project_root()
-    venv_dir = project_root / ".venv"
-    
-    if os.name == 'nt':  # Windows
-        return venv_dir / "Scripts" / "python.exe"
-    else:  # Unix-like (macOS, Linux)
-        return venv_dir / "bin" / "python"
+    return VENV_PYTHON
 
 def check_venv_exists() -> bool:
-    """Check if virtual environment exists"""
-    venv_python = get_venv_python()
-    return venv_python.exists()
+    """Check if virtual environment exists and its interpreter is executable"""
+    return os.access(VENV_PYTHON, os.X_OK)
 
 def ensure_venv_setup():
     """Ensure virtual environment is set up"""
@@ -43,22 +39,33 @@ def run_script_with_venv(script_name: str, args: list = None) -> int:
     """Run a Python script using the virtual environment"""
     ensure_venv_setup()
     
-    venv_python = get_venv_python()
-    scripts_dir = Path(__file__).parent
-    script_path = scripts_dir / script_name
+    script_path = PROJECT_ROOT / "scripts" / script_name
     
     if not script_path.exists():
         print(f"❌ Script not found: {script_path}")
         sys.exit(1)
     
     # Build command
-    cmd = [str(venv_python), str(script_path)]
+    cmd = [str(VENV_PYTHON), str(script_path)]
     if args:
         cmd.extend(args)
     
-    # Run the script
+    # Replace this process with the venv interpreter instead of forking a
+    # child and waiting on it; exit codes and signals then go straight
+    # to the caller
+    if os.name != 'nt':
+        try:
+            os.chdir(PROJECT_ROOT)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.execv(cmd[0], cmd)
+        except OSError as e:
+            print(f"❌ Error running script: {e}")
+            return 1
+    
+    # Windows has no real exec, so run the script as a child process
     try:
-        result = subprocess.run(cmd, cwd=get_project_root())
+        result = subprocess.run(cmd, cwd=PROJECT_ROOT)
         return result.returncode
     except KeyboardInterrupt:
         print("\n🛑 Interrupted by user")
@@ -2,36 +2,77 @@
 
 """
 sync-versions.py - Synchronize versions from versions.yml across all project files
-Usage: python sync-versions.py [--dry-run] [--verbose]
+Usage: python sync-versions.py [--dry-run] [--verbose] [--check] [--durable]
 """
 
+import os
+import mmap
 import re
+import sys
+import json
+import hashlib
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, Union
+
+# Use RE2's linear-time matcher when google-re2 is installed
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 # Import common utilities
-from common import ScriptBase, has_rich, get_console
+from common import ScriptBase, has_rich, get_console, disable_rich, replace_file_atomically
+
+if has_rich():
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+else:
+    Table = Panel = Progress = SpinnerColumn = TextColumn = BarColumn = TaskProgressColumn = None
+
+AnyBytes = Union[bytes, mmap.mmap]
+
+# Files at least this large are memory-mapped when only checked, not read
+MMAP_THRESHOLD = 1024 * 1024
+
+# Below this many files a progress bar costs more to draw than the work it shows
+PROGRESS_MIN_FILES = 16
+
+def compile_pattern(pattern: bytes):
+    """Compile a bytes pattern with RE2 if available, otherwise with re"""
+    if HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
 
 class VersionSyncer(ScriptBase):
     """Version synchronization manager with rich output"""
     
-    def __init__(self, dry_run: bool = False, verbose: bool = False):
+    def __init__(self, dry_run: bool = False, verbose: bool = False, durable: bool = False):
         super().__init__("VersionSyncer", dry_run)
         self.verbose = verbose
+        self.file_manager.durable = durable
         self.versions = self.version_helper.load_versions_file()
         self.changes_made = []
         
-        # Define file patterns and their sync rules
+        # Define file patterns and their sync rules ('literal' is fixed text
+        # every match contains, used to skip the regex when it's absent)
         self.sync_rules = {
             '.github/workflows/ci.yml': [
                 {
                     'pattern': r'go-version:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'go-version:',
                     'version_key': 'go',
                     'replacement': lambda v: f'go-version: \'{v}\''
                 },
                 {
                     'pattern': r'golangci-lint-version:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'golangci-lint-version:',
                     'version_key': 'tools.golangci-lint',
                     'replacement': lambda v: f'golangci-lint-version: \'{v}\''
                 }
@@ -39,6 +80,7 @@ class VersionSyncer(ScriptBase):
             '.github/workflows/docker.yml': [
                 {
                     'pattern': r'GO_VERSION:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'GO_VERSION:',
                     'version_key': 'go',
                     'replacement': lambda v: f'GO_VERSION: \'{v}\''
                 }
@@ -46,6 +88,7 @@ class VersionSyncer(ScriptBase):
             '.github/workflows/codeql.yml': [
                 {
                     'pattern': r'go-version:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'go-version:',
                     'version_key': 'go',
                     'replacement': lambda v: f'go-version: \'{v}\''
                 }
@@ -53,6 +96,7 @@ class VersionSyncer(ScriptBase):
             '.github/workflows/dependencies.yml': [
                 {
                     'pattern': r'go-version:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'go-version:',
                     'version_key': 'go',
                     'replacement': lambda v: f'go-version: \'{v}\''
                 }
@@ -60,6 +104,7 @@ class VersionSyncer(ScriptBase):
             '.github/workflows/release.yml': [
                 {
                     'pattern': r'go-version:\s*[\'"]?([^\'"]+)[\'"]?',
+                    'literal': 'go-version:',
                     'version_key': 'go',
                     'replacement': lambda v: f'go-version: \'{v}\''
                 }
@@ -67,6 +112,7 @@ class VersionSyncer(ScriptBase):
             'Dockerfile': [
                 {
                     'pattern': r'FROM\s+golang:([^\s]+)',
+                    'literal': 'golang:',
                     'version_key': 'go',
                     'replacement': lambda v: f'FROM golang:{v}'
                 }
@@ -74,63 +120,255 @@ class VersionSyncer(ScriptBase):
             'go.mod': [
                 {
                     'pattern': r'go\s+([0-9]+\.[0-9]+(?:\.[0-9]+)?)',
+                    'literal': 'go',
                     'version_key': 'go',
                     'replacement': lambda v: f'go {".".join(v.split(".")[:2])}'  # Use only major.minor for go.mod
                 }
             ]
         }
+        
+        # Compile one alternation of all rule patterns per file so files with
+        # several rules are scanned and rewritten in a single pass. Patterns
+        # work on bytes, so files are never decoded or re-encoded.
+        self.combined_patterns: Dict[str, re.Pattern] = {}
+        self.rule_literals: Dict[str, List[bytes]] = {}
+        for file_path, rules in self.sync_rules.items():
+            combined = '|'.join(
+                f"(?P<r{index}>{rule['pattern']})" for index, rule in enumerate(rules)
+            )
+            self.combined_patterns[file_path] = compile_pattern(combined.encode('utf-8'))
+            self.rule_literals[file_path] = [rule['literal'].encode('utf-8') for rule in rules]
+        
+        # Per-file results of previous sync/check runs, kept inside .git so
+        # the working tree stays clean
+        self.cache_path = self.project_root / '.git' / 'sync-versions-cache.json'
+        self.versions_path = self.project_root / 'versions.yml'
+        
+        # Resolve every referenced version once up front; worker threads then
+        # only read from this dict
+        version_keys = {rule['version_key'] for rules in self.sync_rules.values() for rule in rules}
+        self._version_cache: Dict[str, Optional[str]] = {
+            key: self.version_helper.get_version(key) for key in version_keys
+        }
+        
+        # Encode expected versions and render each rule's replacement text
+        # once, since the versions are fixed for the whole run
+        self._expected_bytes: Dict[str, List[Optional[bytes]]] = {}
+        self._replacements: Dict[str, List[Optional[bytes]]] = {}
+        for file_path, rules in self.sync_rules.items():
+            expected, rendered = [], []
+            for rule in rules:
+                version = self._version_cache[rule['version_key']]
+                if version is None:
+                    expected.append(None)
+                    rendered.append(None)
+                else:
+                    expected.append(version.encode('utf-8'))
+                    rendered.append(rule['replacement'](version).encode('utf-8'))
+            self._expected_bytes[file_path] = expected
+            self._replacements[file_path] = rendered
+        
+        # Fingerprint each file's rules and the text they render, so a cached
+        # result is dropped when its rules or expected versions change
+        self._rule_hashes: Dict[str, str] = {
+            file_path: hashlib.blake2b(repr([
+                (rule['pattern'], rule['version_key'], replacement)
+                for rule, replacement in zip(rules, self._replacements[file_path])
+            ]).encode('utf-8'), digest_size=16).hexdigest()
+            for file_path, rules in self.sync_rules.items()
+        }
+        
+        # Resolve absolute paths once so the file loops don't redo pathlib work
+        self._resolved_sync_rules: List[Tuple[str, Path, List[Dict]]] = [
+            (file_path, self.project_root / file_path, rules)
+            for file_path, rules in self.sync_rules.items()
+        ]
+        self._max_workers = max(1, min(8, len(self._resolved_sync_rules)))
     
-
+    def _versions_hash(self) -> Optional[str]:
+        """Hash the content of versions.yml; an mtime alone misses same-size
+        edits made within the filesystem's timestamp granularity"""
+        try:
+            return hashlib.blake2b(self.versions_path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            return None
     
-    def _sync_file(self, file_path: Path, rules: List[Dict]) -> bool:
-        """Sync versions in a single file"""
-        relative_path = file_path.relative_to(self.project_root)
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached per-file results, discarding them if versions.yml changed"""
+        try:
+            cache = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
         
-        if not file_path.exists():
-            self.logger.warn(f"File not found: {relative_path}")
-            return False
+        if not isinstance(cache, dict) or cache.get('versions_yml_hash') != self._versions_hash():
+            return {}
+        return cache.get('files', {})
+    
+    def _save_cache(self, files: Dict[str, Dict]):
+        """Persist per-file results for the next run"""
+        if not self.cache_path.parent.is_dir():
+            return
         
-        content = self.file_manager.read_file(file_path)
-        if content is None:
-            return False
+        cache = {'versions_yml_hash': self._versions_hash(), 'files': files}
+        try:
+            replace_file_atomically(self.cache_path, json.dumps(cache, indent=2).encode('utf-8'))
+        except OSError as e:
+            self.logger.verbose(f"Could not write {self.cache_path}: {e}", self.verbose)
+    
+    @staticmethod
+    def _match_version(match: re.Match) -> Tuple[int, bytes]:
+        """Get the rule index and captured version of a combined-pattern match"""
+        # Each rule is wrapped in a named group; its version capture follows it.
+        # RE2 reports group names as bytes, which the slice and lookup accept too
+        group_index = match.re.groupindex[match.lastgroup]
+        return int(match.lastgroup[1:]), match.group(group_index + 1)
+    
+    def _file_in_sync(self, relative_path: str, data: AnyBytes) -> bool:
+        """Check whether every rule match already carries the expected version"""
+        # find() rather than 'in', which doesn't search for substrings on mmap
+        expected_bytes = []
+        for literal, expected_version in zip(self.rule_literals[relative_path],
+                                             self._expected_bytes[relative_path]):
+            # A rule whose fixed anchor text is absent cannot match at all
+            if data.find(literal) == -1:
+                expected_bytes.append(None)
+                continue
+            if expected_version is None or data.find(expected_version) == -1:
+                return False
+            expected_bytes.append(expected_version)
+        
+        if not any(expected_bytes):
+            return True
+        
+        for match in self.combined_patterns[relative_path].finditer(data):
+            index, version = self._match_version(match)
+            if version != expected_bytes[index]:
+                return False
+        return True
+    
+    @staticmethod
+    def _update_cache(cache: Dict[str, Dict], relative_path: str, cache_entry: Optional[Dict]):
+        """Store or drop a file's cache entry"""
+        if cache_entry is None:
+            cache.pop(relative_path, None)
+        else:
+            cache[relative_path] = cache_entry
+    
+    def _scan_file(self, relative_path: str, file_path: Path, rules: List[Dict],
+                   cached: Optional[Dict], apply: bool) -> Tuple[List[Dict], List[Dict], Optional[Dict]]:
+        """Scan a file once, returning the changes written (when applying),
+        the version inconsistencies found and the file's cache entry"""
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            if apply:
+                self.logger.warn(f"File not found: {relative_path}")
+            return [], [], None
+        
+        # Unchanged since it was last seen in sync: skip reading it at all
+        cache_entry = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'rules': self._rule_hashes[relative_path],
+            'consistent': True
+        }
+        if cached == cache_entry:
+            return [], [], cache_entry
+        
+        # Large files that are only checked are mapped rather than copied
+        # into memory; the regex runs over the mapping directly
+        if not apply and stat.st_size >= MMAP_THRESHOLD:
+            try:
+                with open(file_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._scan_data(relative_path, file_path, rules, data, cache_entry, apply)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Failed to read {file_path}: {e}")
+                return [], [], None
+        
+        data = self.file_manager.read_bytes(file_path)
+        if data is None:
+            return [], [], None
+        return self._scan_data(relative_path, file_path, rules, data, cache_entry, apply)
+    
+    def _scan_data(self, relative_path: str, file_path: Path, rules: List[Dict], data: AnyBytes,
+                   cache_entry: Dict, apply: bool) -> Tuple[List[Dict], List[Dict], Optional[Dict]]:
+        """Scan a file's content for _scan_file"""
+        if apply:
+            for rule in rules:
+                if self._version_cache[rule['version_key']] is None:
+                    self.logger.error(f"Error processing {rule['version_key']} in {relative_path}: version not found")
+        
+        # Common case: everything matches, so there is nothing to rewrite or report
+        if self._file_in_sync(relative_path, data):
+            return [], [], cache_entry
         
-        original_content = content
         changes_in_file = []
+        inconsistencies = []
+        pattern = self.combined_patterns[relative_path]
+        expected_bytes = self._expected_bytes[relative_path]
+        replacements = self._replacements[relative_path]
         
-        for rule in rules:
-            pattern = rule['pattern']
-            version_key = rule['version_key']
-            replacement_func = rule['replacement']
+        # One pass over the file with its combined pattern; the matched
+        # group tells which rule each hit belongs to
+        def replace_match(match):
+            index, found_version = self._match_version(match)
+            expected_bytes_version = expected_bytes[index]
+            if found_version == expected_bytes_version:
+                return match.group(0)
             
-            try:
-                expected_version = self.version_helper.get_version(version_key)
-                
-                def replace_match(match):
-                    old_version = match.group(1)
-                    if old_version != expected_version:
-                        changes_in_file.append({
-                            'version_key': version_key,
-                            'old_version': old_version,
-                            'new_version': expected_version
-                        })
-                        return replacement_func(expected_version)
-                    return match.group(0)
-                
-                content = re.sub(pattern, replace_match, content)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing {version_key} in {relative_path}: {e}")
-                continue
+            version_key = rules[index]['version_key']
+            found_version = found_version.decode('utf-8', 'replace')
+            expected_version = self._version_cache[version_key]
+            inconsistencies.append({
+                'file': relative_path,
+                'version_key': version_key,
+                'found_version': found_version,
+                'expected_version': expected_version
+            })
+            if expected_bytes_version is None:
+                return match.group(0)
+            changes_in_file.append({
+                'version_key': version_key,
+                'old_version': found_version,
+                'new_version': expected_version
+            })
+            return replacements[index]
+        
+        try:
+            if apply:
+                content = pattern.sub(replace_match, data)
+            else:
+                for match in pattern.finditer(data):
+                    replace_match(match)
+        except Exception as e:
+            self.logger.error(f"Error processing {relative_path}: {e}")
+            return [], inconsistencies, None
         
-        if changes_in_file:
+        # Replacements can render the same text (e.g. go.mod only keeps
+        # major.minor), so only rewrite when the content actually differs
+        if apply and changes_in_file and content != data:
             self.file_manager.write_file(file_path, content)
-            self.changes_made.extend([{
-                'file': str(relative_path),
-                'changes': changes_in_file
-            }])
-            return True
+            # The new stat is only known after the write; verify it next run
+            return changes_in_file, inconsistencies, None
         
-        return False
+        # Nothing was rewritten; remember whether --check must keep reading
+        # this file (e.g. go.mod's major.minor never matches the full version)
+        cache_entry['consistent'] = not inconsistencies
+        return [], inconsistencies, cache_entry
+    
+    def _record_sync_result(self, cache: Dict[str, Dict], relative_path: str, changes: List[Dict],
+                            inconsistencies: List[Dict], cache_entry: Optional[Dict]) -> bool:
+        """Record a synced file's changes and cache entry on the main thread,
+        returning whether the file changed"""
+        self._update_cache(cache, relative_path, cache_entry)
+        if not changes:
+            return False
+        self.changes_made.append({
+            'file': relative_path,
+            'changes': changes
+        })
+        return True
     
     def sync_all_files(self) -> bool:
         """Sync versions across all configured files"""
@@ -144,35 +382,46 @@ class VersionSyncer(ScriptBase):
         
         total_files = len(self.sync_rules)
         files_changed = 0
+        cache = self._load_cache()
+        use_progress = has_rich() and sys.stdout.isatty() and total_files >= PROGRESS_MIN_FILES
         
-        if has_rich():
-            console = get_console()
-            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        # Files are independent, so read/regex/write them concurrently and
+        # keep progress reporting on the main thread
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(self._scan_file, file_path, full_path, rules, cache.get(file_path), True): file_path
+                for file_path, full_path, rules in self._resolved_sync_rules
+            }
             
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console
-            ) as progress:
-                task = progress.add_task("Syncing files...", total=total_files)
+            if use_progress:
+                console = get_console()
                 
-                for file_path, rules in self.sync_rules.items():
-                    full_path = self.project_root / file_path
-                    progress.update(task, description=f"Syncing {file_path}...")
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]{task.description}"),
+                    BarColumn(),
+                    TaskProgressColumn(),
+                    console=console
+                ) as progress:
+                    task = progress.add_task("Syncing files...", total=total_files)
                     
-                    if self._sync_file(full_path, rules):
-                        files_changed += 1
+                    for future in as_completed(futures):
+                        if self._record_sync_result(cache, futures[future], *future.result()):
+                            files_changed += 1
+                        
+                        progress.advance(task)
+            else:
+                for future in as_completed(futures):
+                    self.logger.verbose(f"Synced {futures[future]}", self.verbose)
                     
-                    progress.advance(task)
-        else:
-            for file_path, rules in self.sync_rules.items():
-                full_path = self.project_root / file_path
-                self.logger.verbose(f"Syncing {file_path}...", self.verbose)
-                
-                if self._sync_file(full_path, rules):
-                    files_changed += 1
+                    if self._record_sync_result(cache, futures[future], *future.result()):
+                        files_changed += 1
+        
+        self._save_cache(cache)
+        
+        # Report changes in configuration order regardless of completion order
+        order = {file_path: index for index, file_path in enumerate(self.sync_rules)}
+        self.changes_made.sort(key=lambda change: order[change['file']])
         
         self._show_summary(files_changed, total_files)
         return not self.has_errors()
@@ -181,8 +430,6 @@ class VersionSyncer(ScriptBase):
         """Show synchronization summary"""
         if has_rich():
             console = get_console()
-            from rich.table import Table
-            from rich.panel import Panel
             
             if self.changes_made:
                 # Create a table of changes
@@ -244,43 +491,24 @@ class VersionSyncer(ScriptBase):
         )
         
         inconsistencies = []
+        cache = self._load_cache()
         
-        for file_path, rules in self.sync_rules.items():
-            full_path = self.project_root / file_path
-            relative_path = full_path.relative_to(self.project_root)
-            
-            if not full_path.exists():
-                continue
-            
-            content = self.file_manager.read_file(full_path)
-            if content is None:
-                continue
-            
-            for rule in rules:
-                pattern = rule['pattern']
-                version_key = rule['version_key']
-                
-                try:
-                    expected_version = self.version_helper.get_version(version_key)
-                    matches = re.findall(pattern, content)
-                    
-                    for match in matches:
-                        if match != expected_version:
-                            inconsistencies.append({
-                                'file': str(relative_path),
-                                'version_key': version_key,
-                                'found_version': match,
-                                'expected_version': expected_version
-                            })
-                
-                except Exception as e:
-                    self.logger.error(f"Error checking {version_key} in {relative_path}: {e}")
+        # Files are independent, so check them concurrently; map() yields
+        # results in configuration order, which keeps the report stable
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            results = executor.map(
+                lambda item: self._scan_file(*item, cache.get(item[0]), False),
+                self._resolved_sync_rules
+            )
+            for (relative_path, _, _), (_, found, cache_entry) in zip(self._resolved_sync_rules, results):
+                inconsistencies.extend(found)
+                self._update_cache(cache, relative_path, cache_entry)
+        
+        self._save_cache(cache)
         
         if inconsistencies:
             if has_rich():
                 console = get_console()
-                from rich.table import Table
-                from rich.panel import Panel
                 
                 table = Table(title="🚨 Version Inconsistencies Found")
                 table.add_column("File", style="cyan", no_wrap=True)
@@ -319,17 +547,20 @@ class VersionSyncer(ScriptBase):
 
 def main():
     """Main entry point"""
-    import sys
-    
     parser = argparse.ArgumentParser(description='Synchronize versions from versions.yml')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be changed without making changes')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose output')
     parser.add_argument('--check', action='store_true', help='Check consistency without making changes')
+    parser.add_argument('--durable', action='store_true', help='fsync updated files before replacing them')
     
     args = parser.parse_args()
     
+    # Consistency checks in CI or piped output don't need rich rendering
+    if args.check and (os.environ.get('CI') or not sys.stdout.isatty()):
+        disable_rich()
+    
     # Create syncer instance
-    syncer = VersionSyncer(dry_run=args.dry_run, verbose=args.verbose)
+    syncer = VersionSyncer(dry_run=args.dry_run, verbose=args.verbose, durable=args.durable)
     
     # Show header
     syncer.rich.print_panel(
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+
+"""
+test_verify_tool_versions.py - Version patterns of verify-tool-versions.py against real tool output
+Usage: python -m unittest test_verify_tool_versions   (from the scripts directory)
+"""
+
+import importlib.util
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+_spec = importlib.util.spec_from_file_location("verify_tool_versions", SCRIPTS_DIR / "verify-tool-versions.py")
+verify_tool_versions = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(verify_tool_versions)
+
+COMMANDS = verify_tool_versions._VERSION_COMMANDS
+
+GOLANGCI_LINT_OUTPUT = (
+    "golangci-lint has version 2.2.1 built with go1.24.4 from 9e0ba2e4 on 2025-06-29T17:05:15Z\n"
+)
+
+GOTESTSUM_OUTPUT = "gotestsum version 1.12.3\n"
+
+GOSEC_OUTPUT = (
+    "Version: 2.22.5\n"
+    "Git tag: v2.22.5\n"
+    "Build date: 2025-06-11T10:32:44Z\n"
+)
+
+TRIVY_OUTPUT = (
+    "Version: 0.64.1\n"
+    "Vulnerability DB:\n"
+    "  Version: 2\n"
+    "  UpdatedAt: 2025-07-14 06:22:31.207862 +0000 UTC\n"
+    "  NextUpdate: 2025-07-15 06:22:31.207862 +0000 UTC\n"
+    "  DownloadedAt: 2025-07-14 09:12:05.418229 +0000 UTC\n"
+    "Java DB:\n"
+    "  Version: 1\n"
+    "  UpdatedAt: 2025-07-13 01:04:12.839201 +0000 UTC\n"
+    "  NextUpdate: 2025-07-16 01:04:12.839201 +0000 UTC\n"
+    "  DownloadedAt: 2025-07-14 09:12:07.102938 +0000 UTC\n"
+)
+
+GOOSE_OUTPUT = "goose version: v3.24.3\n"
+
+CODEQL_TERSE_OUTPUT = "2.16.1\n"
+
+GO_VERSION_M_OUTPUT = (
+    "/home/dev/go/bin/gocov: go1.24.4\n"
+    "\tpath\tgithub.com/axw/gocov/gocov\n"
+    "\tmod\tgithub.com/axw/gocov\tv1.2.1\th1:BqM6Q7oQHrbVv2+Vt6WWJdS0ovObeAnXZchWnSqdtiE=\n"
+    "\tdep\tgolang.org/x/tools\tv0.21.0\th1:qc0xYgIbsSDt9EyWz05J5wfa7LOVW0YTLOXrqdLAWIw=\n"
+    "\tbuild\t-buildmode=exe\n"
+    "\tbuild\t-compiler=gc\n"
+    "\tbuild\tGOOS=linux\n"
+    "/home/dev/go/bin/gocov-html: go1.24.4\n"
+    "\tpath\tgithub.com/matm/gocov-html/cmd/gocov-html\n"
+    "\tmod\tgithub.com/matm/gocov-html\tv1.4.0\th1:4Ayn4Mvq1oUlaJnNUNTXs0bGnU2fFhG0p0x3fXSa8Bc=\n"
+    "\tdep\tgithub.com/axw/gocov\tv1.1.0\th1:y5U1krExoJDlb/kNtzxyZQmNRprFOFCutWbNjcQvmVM=\n"
+    "\tbuild\t-buildmode=exe\n"
+    "/home/dev/go/bin/go-cover-treemap: go1.24.4\n"
+    "\tpath\tgithub.com/nikolaydubina/go-cover-treemap\n"
+    "\tmod\tgithub.com/nikolaydubina/go-cover-treemap\t(devel)\t\n"
+    "\tdep\tgolang.org/x/tools\tv0.21.0\th1:qc0xYgIbsSDt9EyWz05J5wfa7LOVW0YTLOXrqdLAWIw=\n"
+    "\tbuild\t-buildmode=exe\n"
+)
+
+GO_BINARIES = {
+    'gocov': '/home/dev/go/bin/gocov',
+    'gocov-html': '/home/dev/go/bin/gocov-html',
+    'go-cover-treemap': '/home/dev/go/bin/go-cover-treemap',
+}
+
+def make_verifier():
+    """Create a verifier without running __init__, which loads versions.yml and caches"""
+    verifier = verify_tool_versions.ToolVersionVerifier.__new__(verify_tool_versions.ToolVersionVerifier)
+    verifier.version_commands = COMMANDS
+    verifier._build_info_lock = threading.Lock()
+    verifier._build_info = None
+    return verifier
+
+class VersionPatternTest(unittest.TestCase):
+    """Each tool's compiled pattern against a verbatim sample of its output"""
+    
+    def setUp(self):
+        self.verifier = make_verifier()
+    
+    def parse(self, tool_name, stdout, stderr=''):
+        return self.verifier._parse_version(tool_name, COMMANDS[tool_name], stdout, stderr)
+    
+    def test_golangci_lint(self):
+        match = COMMANDS['golangci-lint']['compiled_pattern'].search(GOLANGCI_LINT_OUTPUT)
+        self.assertEqual(match.group(1), '2.2.1')
+        self.assertEqual(self.parse('golangci-lint', GOLANGCI_LINT_OUTPUT), ('2.2.1', None))
+    
+    def test_gotestsum(self):
+        self.assertEqual(self.parse('gotestsum', GOTESTSUM_OUTPUT), ('1.12.3', None))
+    
+    def test_gotestsum_dev_build(self):
+        version, warning = self.parse('gotestsum', "gotestsum version dev\n")
+        self.assertEqual(version, 'dev')
+        self.assertIn("'dev' version", warning)
+    
+    def test_gosec_ignores_git_tag_and_build_date(self):
+        match = COMMANDS['gosec']['compiled_pattern'].search(GOSEC_OUTPUT)
+        self.assertEqual(match.group(1), '2.22.5')
+        self.assertEqual(self.parse('gosec', GOSEC_OUTPUT), ('2.22.5', None))
+    
+    def test_gosec_on_stderr(self):
+        self.assertEqual(self.parse('gosec', '', GOSEC_OUTPUT), ('2.22.5', None))
+    
+    def test_trivy(self):
+        self.assertEqual(self.parse('trivy', TRIVY_OUTPUT), ('0.64.1', None))
+    
+    def test_trivy_db_block_is_not_the_tool_version(self):
+        # Without the trivy line itself only the indented DB versions remain,
+        # which the line-anchored pattern must not pick up
+        db_block = TRIVY_OUTPUT.split('\n', 1)[1]
+        self.assertIsNone(COMMANDS['trivy']['compiled_pattern'].search(db_block))
+        self.assertIsNone(COMMANDS['trivy']['compiled_pattern'].search(db_block.replace('Version: 2', 'Version: 2.0.1')))
+        version, warning = self.parse('trivy', db_block)
+        self.assertIsNone(version)
+        self.assertIn("Could not parse trivy version", warning)
+    
+    def test_goose(self):
+        self.assertEqual(self.parse('goose', GOOSE_OUTPUT), ('3.24.3', None))
+    
+    def test_codeql_terse(self):
+        self.assertEqual(self.parse('codeql-cli', CODEQL_TERSE_OUTPUT), ('2.16.1', None))
+    
+    def test_mod_line_skips_dep_lines(self):
+        gocov_section = GO_VERSION_M_OUTPUT.split('/home/dev/go/bin/gocov-html:')[0]
+        match = COMMANDS['gocov']['compiled_pattern'].search(gocov_section)
+        self.assertEqual(match.group(1), 'v1.2.1')
+        self.assertEqual(self.parse('gocov', gocov_section), ('1.2.1', None))
+    
+    def test_devel_mod_line_is_not_parsed(self):
+        treemap_section = GO_VERSION_M_OUTPUT.split('/home/dev/go/bin/go-cover-treemap:')[1]
+        version, warning = self.parse('go-cover-treemap', treemap_section)
+        self.assertIsNone(version)
+        self.assertIn("Could not parse go-cover-treemap version", warning)
+
+class GoBuildInfoTest(unittest.TestCase):
+    """The batched 'go version -m' dump split into per-binary sections"""
+    
+    def setUp(self):
+        self.verifier = make_verifier()
+        result = subprocess.CompletedProcess(
+            ['go', 'version', '-m', *GO_BINARIES.values()], 0, GO_VERSION_M_OUTPUT, ''
+        )
+        which_patch = mock.patch.object(verify_tool_versions, '_which', side_effect=GO_BINARIES.get)
+        run_patch = mock.patch.object(verify_tool_versions.subprocess, 'run', return_value=result)
+        which_patch.start()
+        self.mock_run = run_patch.start()
+        self.addCleanup(which_patch.stop)
+        self.addCleanup(run_patch.stop)
+    
+    def test_single_go_invocation(self):
+        self.verifier._go_build_info()
+        self.verifier._go_build_info()
+        self.mock_run.assert_called_once()
+        self.assertEqual(self.mock_run.call_args.args[0], ['go', 'version', '-m', *GO_BINARIES.values()])
+    
+    def test_sections_are_keyed_by_binary(self):
+        build_info = self.verifier._go_build_info()
+        self.assertEqual(set(build_info), set(GO_BINARIES.values()))
+        self.assertTrue(build_info[GO_BINARIES['gocov-html']].startswith('/home/dev/go/bin/gocov-html: go1.24.4\n'))
+        self.assertNotIn('gocov-html', build_info[GO_BINARIES['gocov']])
+    
+    def test_probe_versions_from_batch(self):
+        probe = {
+            tool_name: self.verifier._probe_version(tool_name, COMMANDS[tool_name], binary)
+            for tool_name, binary in GO_BINARIES.items()
+        }
+        self.assertEqual(probe['gocov'], ('1.2.1', None))
+        self.assertEqual(probe['gocov-html'], ('1.4.0', None))
+        self.assertIsNone(probe['go-cover-treemap'][0])
+        self.mock_run.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,139 +2,364 @@
 
 """
 verify-tool-versions.py - Verify actual installed tool versions against versions.yml
-Usage: python verify-tool-versions.py [--fix] [--verbose]
+Usage: python verify-tool-versions.py [--fix] [--verbose] [--fail-fast] [--no-cache]
 """
 
+import os
 import re
 import subprocess
 import argparse
 import json
+import hashlib
+import functools
 import shutil
+import threading
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple, Set
+from typing import Any, Callable, ClassVar, Dict, Optional, List, Tuple, Set
 
 # Import common utilities
-from common import ScriptBase, has_rich, get_console
+from common import ScriptBase, has_rich, get_console, replace_file_atomically
+
+if has_rich():
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+else:
+    Progress = SpinnerColumn = TextColumn = BarColumn = TimeRemainingColumn = None
+
+# Child tools get no terminal on stdin and are asked for plain, uncoloured output
+CHILD_ENV = {**os.environ, 'NO_COLOR': '1', 'TERM': 'dumb'}
+
+# Strips a package path down to its module path for 'go list -m'
+_REPO_STRIP_RE = re.compile(r'/(v[0-9]+|cmd)/.*')
+
+# 'go list -m -u -json' only emits an "Update" field for modules with a newer version
+_HAS_UPDATE_RE = re.compile(r'"Update"\s*:')
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """shutil.which, resolved once per name for the life of the process"""
+    return shutil.which(name)
+
+@functools.lru_cache(maxsize=256)
+def parse_semver(version: str) -> Tuple:
+    """Parse 'v1.2.3-rc.1' into (1, 2, 3, '-rc.1') in a single scan"""
+    length = len(version)
+    index = 1 if version[:1] in ('v', 'V') else 0
+    parts = []
+    while index < length:
+        start = index
+        while index < length and '0' <= version[index] <= '9':
+            index += 1
+        if index == start:
+            break
+        parts.append(int(version[start:index]))
+        # Continue only across a dot that starts another numeric component
+        if index + 1 < length and version[index] == '.' and '0' <= version[index + 1] <= '9':
+            index += 1
+        else:
+            break
+    return (*parts, version[index:])
+
+# Tool version checking commands, shared by every verifier instance
+_VERSION_COMMANDS: Dict[str, Dict[str, Any]] = {
+    'golangci-lint': {
+        'cmd': ['golangci-lint', '--version'],
+        'pattern': r'(?m)^golangci-lint has version ([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.golangci-lint',
+        'go_package': 'github.com/golangci/golangci-lint/cmd/golangci-lint'
+    },
+    'gotestsum': {
+        'cmd': ['gotestsum', '--version'],
+        'pattern': r'(?m)^gotestsum version (\S+)',
+        'version_key': 'tools.gotestsum',
+        'go_package': 'gotest.tools/gotestsum'
+    },
+    'gosec': {
+        'cmd': ['gosec', '--version'],
+        'pattern': r'(?m)^Version: (\S+)',
+        'version_key': 'tools.gosec',
+        'go_package': 'github.com/securego/gosec/v2/cmd/gosec'
+    },
+    'govulncheck': {
+        'cmd': ['govulncheck', '--version'],
+        'pattern': r'govulncheck@v([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.govulncheck',
+        'go_package': 'golang.org/x/vuln/cmd/govulncheck'
+    },
+    'air': {
+        'cmd': ['air', '-v'],
+        'pattern': r'v([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.air',
+        'go_package': 'github.com/air-verse/air'
+    },
+    'trivy': {
+        'cmd': ['trivy', '--version'],
+        'pattern': r'(?m)^Version: ([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.trivy',
+        'go_package': None  # trivy is not a Go tool
+    },
+    'goose': {
+        'cmd': ['goose', '--version'],
+        'pattern': r'(?m)^goose version: v([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.goose',
+        'go_package': 'github.com/pressly/goose/v3/cmd/goose'
+    },
+    'gocov': {
+        'cmd': ['go', 'version', '-m'], # Special check
+        'pattern': r'(?m)^\tmod\t\S+\t(v[0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.gocov',
+        'go_package': 'github.com/axw/gocov/gocov',
+        'use_go_version_m': True
+    },
+    'gocov-html': {
+        'cmd': ['go', 'version', '-m'], # Special check
+        'pattern': r'(?m)^\tmod\t\S+\t(v[0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.gocov-html',
+        'go_package': 'github.com/matm/gocov-html/cmd/gocov-html',
+        'use_go_version_m': True
+    },
+    'go-cover-treemap': {
+        'cmd': ['go', 'version', '-m'], # Special check
+        'pattern': r'(?m)^\tmod\t\S+\t(v[0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.go-cover-treemap',
+        'go_package': 'github.com/nikolaydubina/go-cover-treemap',
+        'use_go_version_m': True
+    },
+    'codeql-cli': {
+        'cmd': ['codeql', 'version', '--format=terse'],
+        'pattern': r'(?m)^([0-9]+\.[0-9]+\.[0-9]+)',
+        'version_key': 'tools.codeql-cli',
+        'go_package': None
+    }
+}
+
+# Compile each version pattern once at import rather than on every probe
+for _config in _VERSION_COMMANDS.values():
+    _config['compiled_pattern'] = re.compile(_config['pattern'])
+del _config
 
 class ToolVersionVerifier(ScriptBase):
     """Tool version verification with actual installed version checking"""
     
-    def __init__(self, fix_versions: bool = False, verbose: bool = False):
+    # Shared subprocess settings for quick probes and for streamed installs
+    _PROBE_KWARGS: ClassVar[Dict[str, Any]] = {
+        'stdin': subprocess.DEVNULL,
+        'capture_output': True,
+        'text': True,
+        'timeout': 5,
+        'env': CHILD_ENV
+    }
+    _INSTALL_KWARGS: ClassVar[Dict[str, Any]] = {
+        'stdin': subprocess.DEVNULL,
+        'stdout': subprocess.PIPE,
+        'stderr': subprocess.STDOUT,
+        'text': True,
+        'bufsize': 1,
+        'env': CHILD_ENV
+    }
+    
+    def __init__(self, fix_versions: bool = False, verbose: bool = False, fail_fast: bool = False,
+                 use_cache: bool = True):
         super().__init__("ToolVersionVerifier")
         self.fix_versions = fix_versions
         self.verbose = verbose
+        self.fail_fast = fail_fast
+        self.use_cache = use_cache
         self.versions = self.version_helper.load_versions_file()
         self.mismatches = []
+        self._gopath_cache: Optional[str] = None
+        self._script_cache: Dict[str, bytes] = {}
+        self._console = get_console() if has_rich() else None
+        self._build_info_lock = threading.Lock()
+        self._build_info: Optional[Dict[str, str]] = None
         
-        # Tool version checking commands
-        self.version_commands = {
-            'golangci-lint': {
-                'cmd': ['golangci-lint', '--version'],
-                'pattern': r'golangci-lint has version ([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.golangci-lint',
-                'go_package': 'github.com/golangci/golangci-lint/cmd/golangci-lint'
-            },
-            'gotestsum': {
-                'cmd': ['gotestsum', '--version'],
-                'pattern': r'gotestsum version (.+)',
-                'version_key': 'tools.gotestsum',
-                'go_package': 'gotest.tools/gotestsum'
-            },
-            'gosec': {
-                'cmd': ['gosec', '--version'],
-                'pattern': r'Version: (.+)',
-                'version_key': 'tools.gosec',
-                'go_package': 'github.com/securego/gosec/v2/cmd/gosec'
-            },
-            'govulncheck': {
-                'cmd': ['govulncheck', '--version'],
-                'pattern': r'govulncheck@v([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.govulncheck',
-                'go_package': 'golang.org/x/vuln/cmd/govulncheck'
-            },
-            'air': {
-                'cmd': ['air', '-v'],
-                'pattern': r'v([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.air',
-                'go_package': 'github.com/air-verse/air'
-            },
-            'trivy': {
-                'cmd': ['trivy', '--version'],
-                'pattern': r'Version: ([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.trivy',
-                'go_package': None  # trivy is not a Go tool
-            },
-            'goose': {
-                'cmd': ['goose', '--version'],
-                'pattern': r'goose version: v([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.goose',
-                'go_package': 'github.com/pressly/goose/v3/cmd/goose'
-            },
-            'gocov': {
-                'cmd': ['go', 'version', '-m'], # Special check
-                'pattern': r'\tmod\t.*\t(v[0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.gocov',
-                'go_package': 'github.com/axw/gocov/gocov',
-                'use_go_version_m': True
-            },
-            'gocov-html': {
-                'cmd': ['go', 'version', '-m'], # Special check
-                'pattern': r'\tmod\t.*\t(v[0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.gocov-html',
-                'go_package': 'github.com/matm/gocov-html/cmd/gocov-html',
-                'use_go_version_m': True
-            },
-            'go-cover-treemap': {
-                'cmd': ['go', 'version', '-m'], # Special check
-                'pattern': r'\tmod\t.*\t(v[0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.go-cover-treemap',
-                'go_package': 'github.com/nikolaydubina/go-cover-treemap',
-                'use_go_version_m': True
-            },
-            'codeql-cli': {
-                'cmd': ['codeql', 'version', '--format=terse'],
-                'pattern': r'([0-9]+\.[0-9]+\.[0-9]+)',
-                'version_key': 'tools.codeql-cli',
-                'go_package': None
-            }
+        # Probed versions survive across runs, keyed on each binary's stat
+        self._version_cache_path = Path.home() / '.cache' / 'scaffold' / 'tool-versions.json'
+        self._verify_ok_path = Path.home() / '.cache' / 'scaffold' / 'verify-ok.json'
+        self._version_cache = self._load_version_cache() if use_cache else {}
+        self._version_cache_dirty = False
+        
+        self.version_commands = _VERSION_COMMANDS
+        
+        # Bind every tool's probe up front so the probe loop just calls them
+        self._probes: Dict[str, Callable[[], Tuple[Optional[str], Optional[str]]]] = {
+            tool_name: functools.partial(self._run_version_command, tool_name, config)
+            for tool_name, config in self.version_commands.items()
+        }
+        
+        # Look up every expected version once; versions.yml doesn't change mid-run
+        self._expected: Dict[str, Optional[str]] = {
+            tool_name: self._get_expected_version(config['version_key'])
+            for tool_name, config in self.version_commands.items()
         }
     
+    def _load_version_cache(self) -> Dict[str, Dict]:
+        """Load probed tool versions from previous runs"""
+        try:
+            cache = json.loads(self._version_cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
+    
+    def _write_cache_file(self, path: Path, content: str):
+        """Replace a cache file atomically, so concurrent runs never read a partial one"""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            replace_file_atomically(path, content.encode('utf-8'))
+        except OSError as e:
+            self.logger.verbose(f"Could not write {path}: {e}", self.verbose)
+    
+    def _save_version_cache(self):
+        """Persist probed tool versions for the next run"""
+        if self.use_cache and self._version_cache_dirty:
+            self._write_cache_file(self._version_cache_path, json.dumps(self._version_cache, indent=2))
+    
+    @staticmethod
+    def _tool_binary(tool_name: str, config: Dict) -> Optional[str]:
+        """Resolve the binary a tool's version is read from"""
+        # go version -m inspects the tool's own binary rather than running it
+        return _which(tool_name if config.get('use_go_version_m') else config['cmd'][0])
+    
+    def _verification_fingerprint(self) -> Optional[Dict[str, str]]:
+        """Hash versions.yml and the stat of every tool binary"""
+        try:
+            config_hash = hashlib.blake2b(
+                (self.project_root / 'versions.yml').read_bytes(), digest_size=16
+            ).hexdigest()
+        except OSError:
+            return None
+        
+        binaries = hashlib.blake2b(digest_size=16)
+        for tool_name, config in sorted(self.version_commands.items()):
+            binary = self._tool_binary(tool_name, config)
+            try:
+                stat = os.stat(binary) if binary else None
+            except OSError:
+                stat = None
+            entry = (tool_name, binary, stat and stat.st_mtime_ns, stat and stat.st_size)
+            binaries.update(repr(entry).encode('utf-8'))
+        
+        return {'config_hash': config_hash, 'bin_hash': binaries.hexdigest()}
+    
+    def _load_verify_ok(self) -> Optional[Dict[str, str]]:
+        """Load the fingerprint of the last fully successful verification"""
+        try:
+            return json.loads(self._verify_ok_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+    
+    def _save_verify_ok(self, fingerprint: Dict[str, str]):
+        """Remember a fully successful verification"""
+        self._write_cache_file(self._verify_ok_path, json.dumps(fingerprint))
+    
     def _run_version_command(self, tool_name: str, config: Dict) -> Tuple[Optional[str], Optional[str]]:
+        """Get a tool's installed version and any warnings, probing it only
+        when its binary changed since the last run"""
+        binary = self._tool_binary(tool_name, config)
+        if not binary:
+            return None, f"{tool_name} not found in PATH"
+        
+        try:
+            stat = os.stat(binary)
+        except OSError:
+            return None, f"{tool_name} not found in PATH"
+        
+        key = {'path': binary, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'pattern': config['pattern']}
+        cached = self._version_cache.get(tool_name)
+        if cached and cached.get('binary') == key:
+            return cached['version'], cached['warning']
+        
+        # Tools read through 'go version -m' also need go itself; check it
+        # here rather than spawning a probe that can only fail
+        if config.get('use_go_version_m') and not _which(config['cmd'][0]):
+            return None, f"go not found in PATH, cannot read {tool_name} build info"
+
+        version, warning = self._probe_version(tool_name, config, binary)
+        if version is not None:
+            # Each probe thread writes only its own tool's entry
+            self._version_cache[tool_name] = {'binary': key, 'version': version, 'warning': warning}
+            self._version_cache_dirty = True
+        return version, warning
+    
+    def _go_build_info(self) -> Dict[str, str]:
+        """Read the build info of every 'go version -m' tool with one go invocation,
+        returning each binary's section of the output keyed by its path"""
+        with self._build_info_lock:
+            if self._build_info is not None:
+                return self._build_info
+            
+            self._build_info = {}
+            binaries = [
+                binary for binary in (
+                    self._tool_binary(tool_name, config)
+                    for tool_name, config in self.version_commands.items()
+                    if config.get('use_go_version_m')
+                ) if binary
+            ]
+            if not binaries:
+                return self._build_info
+            
+            try:
+                result = subprocess.run(['go', 'version', '-m', *binaries], **self._PROBE_KWARGS)
+            except (subprocess.TimeoutExpired, OSError):
+                return self._build_info
+            
+            # Each binary's section starts with an unindented "<path>: <go version>"
+            # line; go still prints the readable ones when another one fails
+            binary, lines = None, []
+            for line in result.stdout.splitlines(keepends=True) + ['']:
+                if line[:1] in ('\t', ' '):
+                    lines.append(line)
+                    continue
+                if binary is not None:
+                    self._build_info[binary] = ''.join(lines)
+                binary, lines = line.rsplit(': ', 1)[0], [line]
+            return self._build_info
+    
+    def _parse_version(self, tool_name: str, config: Dict, stdout: str,
+                       stderr: str = '') -> Tuple[Optional[str], Optional[str]]:
+        """Extract a tool's version and any warnings from its output"""
+        # Tools print their version to one stream or the other; search
+        # each in turn instead of joining them
+        pattern = config['compiled_pattern']
+        match = pattern.search(stdout) or pattern.search(stderr)
+        
+        if match:
+            version = match.group(1)
+            if version == 'dev' or version == 'devel':
+                warning = f"{tool_name} reports 'dev' version - installed from source"
+                return 'dev', warning
+            return version.removeprefix('v'), None
+        else:
+            output = (stdout + stderr).strip()
+            warning = f"Could not parse {tool_name} version from: {output}"
+            return None, warning
+    
+    def _probe_version(self, tool_name: str, config: Dict, binary: str) -> Tuple[Optional[str], Optional[str]]:
         """Run version command for a tool and extract version and any warnings."""
         warning = None
         cmd = config['cmd']
 
-        # For tools without a version flag, check binary build info
+        # For tools without a version flag, check binary build info; all
+        # such tools share one batched go invocation, falling back to their
+        # own if their section is missing from it
         if config.get('use_go_version_m'):
-            tool_path = shutil.which(tool_name)
-            if not tool_path:
-                return None, f"{tool_name} not found in PATH"
-            cmd = cmd + [tool_path]
+            build_info = self._go_build_info().get(binary)
+            if build_info is not None:
+                return self._parse_version(tool_name, config, build_info)
+            cmd = cmd + [binary]
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
+            result = subprocess.run(cmd, **self._PROBE_KWARGS)
             
             if result.returncode != 0:
                 warning = f"Failed to get {tool_name} version: {result.stderr.strip()}"
                 return None, warning
             
-            output = result.stdout + result.stderr
-            match = re.search(config['pattern'], output)
-            
-            if match:
-                version = match.group(1)
-                if version == 'dev' or version == 'devel':
-                    warning = f"{tool_name} reports 'dev' version - installed from source"
-                    return 'dev', warning
-                return version.lstrip('v'), None
-            else:
-                warning = f"Could not parse {tool_name} version from: {output.strip()}"
-                return None, warning
+            return self._parse_version(tool_name, config, result.stdout, result.stderr)
                 
         except subprocess.TimeoutExpired:
             return None, f"Timeout getting {tool_name} version"
@@ -144,27 +369,36 @@ class ToolVersionVerifier(ScriptBase):
             return None, f"Error getting {tool_name} version: {e}"
     
     def _get_expected_version(self, version_key: str) -> Optional[str]:
-        """Get expected version from versions.yml"""
+        """Get expected version from the versions.yml data loaded in __init__"""
         try:
-            return self.version_helper.get_version(version_key)
+            # Same lookup as version_helper.get_version, without re-checking the file
+            section, _, subkey = version_key.partition('.')
+            value = self.versions.get(section)
+            if subkey:
+                return value.get(subkey) if isinstance(value, dict) else None
+            return value
         except Exception as e:
             self.logger.error(f"Error getting expected version for {version_key}: {e}")
             return None
     
-    def _versions_match(self, installed: str, expected: str) -> bool:
+    @staticmethod
+    def _versions_match(installed: str, expected: str) -> bool:
         """Check if installed version matches expected version"""
         if installed == expected:
             return True
         
-        # Handle version prefix variations (v1.2.3 vs 1.2.3)
-        if installed.lstrip('v') == expected.lstrip('v'):
-            return True
-        
         # Handle dev versions
         if installed == 'dev':
             return False
         
-        return False
+        # Compare numerically, so v1.2.3, 1.2.3 and 01.02.03 are all equal
+        return parse_semver(installed) == parse_semver(expected)
+    
+    def _probe_ok(self, tool_name: str, installed_version: Optional[str]) -> bool:
+        """Check whether a probed tool matches its expected version"""
+        expected_version = self._expected[tool_name]
+        return (installed_version is not None and expected_version is not None
+                and self._versions_match(installed_version, expected_version))
     
     def verify_tool_versions(self) -> bool:
         """Verify all tool versions"""
@@ -173,31 +407,75 @@ class ToolVersionVerifier(ScriptBase):
             title="🔧 Tool Version Verification"
         )
 
+        # Nothing changed since the last run where everything matched
+        fingerprint = self._verification_fingerprint() if self.use_cache else None
+        if not self.fix_versions and fingerprint is not None and fingerprint == self._load_verify_ok():
+            self.rich.print_panel("✅ All tool versions match versions.yml", title="🎉 All Good!", style="green")
+            return True
+        
         # --- Phase 1: Gather all data silently ---
         results = []
         all_good = True
+        mismatch_count = 0
+        fix_mode = self.fix_versions
+        fail_fast = self.fail_fast and not fix_mode
         
-        for tool_name, config in self.version_commands.items():
-            installed_version, warning = self._run_version_command(tool_name, config)
-            expected_version = self._get_expected_version(config['version_key'])
+        # Probes are independent subprocesses, so run them concurrently
+        # behind a single status spinner
+        with self.rich.status_context("Checking tool versions..."), \
+                ThreadPoolExecutor(max_workers=min(16, len(self._probes))) as executor:
+            futures = {executor.submit(probe): tool_name for tool_name, probe in self._probes.items()}
+            for future in as_completed(futures):
+                # With --fail-fast the first bad tool decides the outcome, so
+                # probes that haven't started yet are dropped
+                if fail_fast and not self._probe_ok(futures[future], future.result()[0]):
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        
+        probes = {
+            tool_name: future.result()
+            for future, tool_name in futures.items()
+            if not future.cancelled()
+        }
+        
+        # The table is filled in configuration order from the collected
+        # results and rendered once
+        for tool_name in self._probes:
+            expected_version = self._expected[tool_name]
+            if tool_name not in probes:
+                results.append({
+                    "tool": tool_name,
+                    "installed": "N/A",
+                    "expected": expected_version or "?",
+                    "status": "⏭️  Skipped",
+                    "warning": None
+                })
+                continue
+            
+            installed_version, warning = probes[tool_name]
             
             status = "✅ Match"
             if installed_version is None:
                 status = "❌ Missing"
                 all_good = False
-                self.mismatches.append({
-                    'tool': tool_name, 'installed': None, 'expected': expected_version, 'status': 'missing'
-                })
+                mismatch_count += 1
+                # Mismatch details are only needed to drive --fix
+                if fix_mode:
+                    self.mismatches.append({
+                        'tool': tool_name, 'installed': None, 'expected': expected_version, 'status': 'missing'
+                    })
             elif expected_version is None:
                 status = "❌ Undefined"
                 all_good = False
             elif not self._versions_match(installed_version, expected_version):
                 status = "❌ Mismatch"
                 all_good = False
-                self.mismatches.append({
-                    'tool': tool_name, 'installed': installed_version, 'expected': expected_version, 'status': 'mismatch'
-                })
-
+                mismatch_count += 1
+                if fix_mode:
+                    self.mismatches.append({
+                        'tool': tool_name, 'installed': installed_version, 'expected': expected_version, 'status': 'mismatch'
+                    })
+            
             results.append({
                 "tool": tool_name,
                 "installed": installed_version or "N/A",
@@ -205,21 +483,21 @@ class ToolVersionVerifier(ScriptBase):
                 "status": status,
                 "warning": warning
             })
+        
+        self._save_version_cache()
 
         # --- Phase 2: Print clean report ---
-        table = self.rich.create_table(title="🔍 Tool Version Check Results")
-        table.add_column("Tool", style="cyan", no_wrap=True)
-        table.add_column("Installed", style="yellow")
-        table.add_column("Expected", style="blue")
-        table.add_column("Status", style="bold")
-        
-        warnings_to_show = []
-        for res in results:
-            table.add_row(res['tool'], res['installed'], res['expected'], res['status'])
-            if res['warning']:
-                warnings_to_show.append(res['warning'])
-        
-        self.rich.print_table(table)
+        self.rich.print_rows(
+            "🔍 Tool Version Check Results",
+            {
+                "Tool": {"style": "cyan", "no_wrap": True},
+                "Installed": {"style": "yellow"},
+                "Expected": {"style": "blue"},
+                "Status": {"style": "bold"}
+            },
+            [(res['tool'], res['installed'], res['expected'], res['status']) for res in results]
+        )
+        warnings_to_show = [res['warning'] for res in results if res['warning']]
         print() # Add a newline for spacing
 
         if warnings_to_show:
@@ -229,10 +507,12 @@ class ToolVersionVerifier(ScriptBase):
         # --- Phase 3: Show summary and handle fixes ---
         if all_good:
             self.rich.print_panel("✅ All tool versions match versions.yml", title="🎉 All Good!", style="green")
+            if fingerprint is not None:
+                self._save_verify_ok(fingerprint)
         else:
-            self.rich.print_panel(f"❌ Found {len(self.mismatches)} version mismatches", title="⚠️  Mismatches Detected", style="red")
+            self.rich.print_panel(f"❌ Found {mismatch_count} version mismatches", title="⚠️  Mismatches Detected", style="red")
         
-        if self.fix_versions and self.mismatches:
+        if fix_mode and self.mismatches:
             self._fix_tool_versions()
         
         return all_good
@@ -251,18 +531,32 @@ class ToolVersionVerifier(ScriptBase):
             self.logger.info(f"Installing {tool_name} version {version}...")
             self.logger.verbose(f"Running: {' '.join(cmd)}", self.verbose)
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60  # Give it more time for installation
-            )
+            # Stream go's output and keep only the tail for error reporting, so
+            # verbose build logs don't pile up in memory across parallel installs
+            tail = deque(maxlen=50)
+            timed_out = threading.Event()
+            with subprocess.Popen(cmd, **self._INSTALL_KWARGS) as proc:
+                def kill():
+                    timed_out.set()
+                    proc.kill()
+                
+                timer = threading.Timer(60, kill)  # Give it more time for installation
+                timer.start()
+                try:
+                    for line in proc.stdout:
+                        tail.append(line)
+                    returncode = proc.wait()
+                finally:
+                    timer.cancel()
             
-            if result.returncode == 0:
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(cmd, 60)
+            
+            if returncode == 0:
                 self.logger.success(f"✅ Successfully installed {tool_name} v{version}")
                 return True
             else:
-                self.logger.error(f"❌ Failed to install {tool_name}: {result.stderr.strip()}")
+                self.logger.error(f"❌ Failed to install {tool_name}: {''.join(tail).strip()}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -272,22 +566,22 @@ class ToolVersionVerifier(ScriptBase):
             self.logger.error(f"❌ Error installing {tool_name}: {e}")
             return False
 
+    def _get_gopath(self) -> Optional[str]:
+        """Get GOPATH from the go tool, asking it only once per run"""
+        if self._gopath_cache is None:
+            result = subprocess.run(['go', 'env', 'GOPATH'], **self._PROBE_KWARGS)
+            if result.returncode == 0:
+                self._gopath_cache = result.stdout.strip()
+        return self._gopath_cache
+
     def _install_gosec_with_script(self, version: str) -> bool:
         """Install gosec using the official installation script"""
         try:
-            # Get GOPATH
-            gopath_result = subprocess.run(
-                ['go', 'env', 'GOPATH'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if gopath_result.returncode != 0:
+            gopath = self._get_gopath()
+            if gopath is None:
                 self.logger.error("❌ Failed to get GOPATH")
                 return False
             
-            gopath = gopath_result.stdout.strip()
             bin_dir = f"{gopath}/bin"
             
             # Download and run gosec installer
@@ -295,23 +589,38 @@ class ToolVersionVerifier(ScriptBase):
             version_with_prefix = f"v{version}"
             
             self.logger.info(f"Installing gosec version {version} using official installer...")
-            self.logger.verbose(f"Running: curl -sfL {install_url} | sh -s -- -b {bin_dir} {version_with_prefix}", self.verbose)
             
-            # Use shell=True to properly handle pipes
-            cmd = f"curl -sfL {install_url} | sh -s -- -b {bin_dir} {version_with_prefix}"
+            # Download the installer in-process (once per run) and feed it to
+            # sh on stdin, rather than spawning a shell to pipe curl into sh
+            script = self._script_cache.get(install_url)
+            if script is None:
+                self.logger.verbose(f"Downloading {install_url}", self.verbose)
+                try:
+                    with urllib.request.urlopen(install_url, timeout=30) as response:
+                        script = response.read()
+                except (urllib.error.URLError, OSError) as e:
+                    reason = getattr(e, 'reason', e)
+                    self.logger.error(f"❌ Failed to download gosec installer from {install_url}: {reason}")
+                    return False
+                self._script_cache[install_url] = script
+            
+            cmd = ['sh', '-s', '--', '-b', bin_dir, version_with_prefix]
+            self.logger.verbose(f"Running: {' '.join(cmd)}", self.verbose)
+            
             result = subprocess.run(
                 cmd,
-                shell=True,
+                input=script,
                 capture_output=True,
-                text=True,
-                timeout=120  # Give more time for download
+                timeout=120,
+                env=CHILD_ENV
             )
             
             if result.returncode == 0:
                 self.logger.success(f"✅ Successfully installed gosec v{version}")
                 return True
             else:
-                self.logger.error(f"❌ Failed to install gosec: {result.stderr.strip()}")
+                stderr = result.stderr.decode('utf-8', 'replace').strip()
+                self.logger.error(f"❌ Failed to install gosec: {stderr}")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -331,9 +640,6 @@ class ToolVersionVerifier(ScriptBase):
             title="🔧 Auto-fix Tool Versions"
         )
         
-        console = get_console()
-        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-        
         # Filter mismatches to only Go tools that can be installed
         fixable_mismatches = []
         for mismatch in self.mismatches:
@@ -350,66 +656,92 @@ class ToolVersionVerifier(ScriptBase):
             self.logger.warn("No fixable mismatches found (all tools are either correct or not Go tools)")
             return
         
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold blue]{task.description}"),
-            BarColumn(),
-            TimeRemainingColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("Installing tools...", total=len(fixable_mismatches))
-            
-            success_count = 0
-            for mismatch in fixable_mismatches:
-                tool_name = mismatch['tool']
-                expected_version = mismatch['expected']
-                go_package = self.version_commands[tool_name]['go_package']
-                
-                progress.update(task, description=f"Installing {tool_name} v{expected_version}...")
-                
-                if self._install_go_tool(tool_name, go_package, expected_version):
-                    success_count += 1
-                
-                progress.advance(task)
+        # Installs are independent, so run a few at once; the cap keeps
+        # go from contending too hard on the module/build cache and network
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=min(4, len(fixable_mismatches))) as executor:
+            futures = [
+                executor.submit(
+                    self._install_go_tool,
+                    mismatch['tool'],
+                    self.version_commands[mismatch['tool']]['go_package'],
+                    mismatch['expected']
+                )
+                for mismatch in fixable_mismatches
+            ]
             
-            # Show summary
-            if success_count == len(fixable_mismatches):
-                from rich.panel import Panel
-                console.print(Panel(
-                    f"✅ Successfully installed {success_count} tools",
-                    title="🎉 All Tools Fixed!",
-                    style="green"
-                ))
+            if self._console is not None:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold blue]{task.description}"),
+                    BarColumn(),
+                    TimeRemainingColumn(),
+                    console=self._console
+                ) as progress:
+                    task = progress.add_task("Installing tools...", total=len(fixable_mismatches))
+                    
+                    for future in as_completed(futures):
+                        if future.result():
+                            success_count += 1
+                        
+                        progress.advance(task)
             else:
-                from rich.panel import Panel
-                console.print(Panel(
-                    f"⚠️  Installed {success_count}/{len(fixable_mismatches)} tools",
-                    title="Partial Success",
-                    style="yellow"
-                ))
+                for future in as_completed(futures):
+                    if future.result():
+                        success_count += 1
+        
+        # Show summary
+        if success_count == len(fixable_mismatches):
+            self.rich.print_panel(
+                f"✅ Successfully installed {success_count} tools",
+                title="🎉 All Tools Fixed!",
+                style="green"
+            )
+        else:
+            self.rich.print_panel(
+                f"⚠️  Installed {success_count}/{len(fixable_mismatches)} tools",
+                title="Partial Success",
+                style="yellow"
+            )
 
     def check_outdated_tools(self):
         """Check for outdated Go tools."""
         self.rich.print_panel("Checking for outdated tools...", style="bold blue")
         
-        outdated_tools = []
+        # Resolve each Go tool to its module path first; tools sharing a
+        # module are only queried once
+        checks = []
         for tool_name, config in self.version_commands.items():
             if not config.get('go_package'):
                 self.logger.verbose(f"Skipping update check for {tool_name} (not a Go tool).")
                 continue
 
-            package = config['go_package']
             # Strip subdirectories like /cmd/ for the check
-            repo_path = re.sub(r'/(v[0-9]+|cmd)/.*', '', package)
-
-            current_version = self.version_helper.get_version(config['version_key'])
-            
+            checks.append((tool_name, _REPO_STRIP_RE.sub('', config['go_package'])))
+        
+        repo_paths = list(dict.fromkeys(repo_path for _, repo_path in checks))
+        for repo_path in repo_paths:
             self.logger.verbose(f"Checking {repo_path} for updates...")
-            success, result = self.cmd_runner.run(['go', 'list', '-m', '-u', '-json', f'{repo_path}@latest'])
+        
+        # Each query is a round trip to the module proxy, so run them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(repo_paths) or 1)) as executor:
+            responses = dict(zip(repo_paths, executor.map(
+                lambda repo_path: self.cmd_runner.run(['go', 'list', '-m', '-u', '-json', f'{repo_path}@latest']),
+                repo_paths
+            )))
+        
+        outdated_tools = []
+        for tool_name, repo_path in checks:
+            current_version = self._expected[tool_name]
+            success, result = responses[repo_path]
             
             if not success:
                 self.logger.error(f"Failed to check for updates for {repo_path}: {result}")
                 continue
+            
+            # Up-to-date modules need no JSON parse at all
+            if _HAS_UPDATE_RE.search(result) is None:
+                continue
 
             try:
                 data = json.loads(result)
@@ -428,14 +760,16 @@ class ToolVersionVerifier(ScriptBase):
         if not outdated_tools:
             self.logger.success("All Go tools in versions.yml are up to date.")
         else:
-            table = self.rich.create_table(title="Outdated Go Tools")
-            table.add_column("Tool", style="cyan")
-            table.add_column("Go Package", style="white")
-            table.add_column("Current Version", style="yellow")
-            table.add_column("Latest Version", style="green")
-            for tool in outdated_tools:
-                table.add_row(tool['tool'], tool['package'], tool['current'], tool['latest'])
-            self.rich.print_table(table)
+            self.rich.print_rows(
+                "Outdated Go Tools",
+                {
+                    "Tool": {"style": "cyan"},
+                    "Go Package": {"style": "white"},
+                    "Current Version": {"style": "yellow"},
+                    "Latest Version": {"style": "green"}
+                },
+                [(tool['tool'], tool['package'], tool['current'], tool['latest']) for tool in outdated_tools]
+            )
 
 def main():
     """Main entry point"""
@@ -455,9 +789,24 @@ def main():
         action='store_true',
         help='Enable verbose output for debugging.'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Probe every tool instead of reusing versions cached from earlier runs.'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop probing at the first missing or mismatched tool (ignored with --fix).'
+    )
     args = parser.parse_args()
 
-    verifier = ToolVersionVerifier(fix_versions=args.fix, verbose=args.verbose)
+    verifier = ToolVersionVerifier(
+        fix_versions=args.fix,
+        verbose=args.verbose,
+        fail_fast=args.fail_fast,
+        use_cache=not args.no_cache
+    )
     
     if args.check_outdated:
         verifier.check_outdated_tools()
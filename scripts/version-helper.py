@@ -14,15 +14,24 @@ import sys
 import argparse
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Try to import yaml, fall back to simple parser if not available
 try:
     import yaml
     HAS_YAML = True
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader
 except ImportError:
     HAS_YAML = False
 
+# Parsed versions.yml keyed by (path, mtime_ns), so repeated get_version()
+# calls in one process don't re-read and re-parse the file
+_versions_cache: Optional[Tuple[Tuple[str, int], Dict[str, Any]]] = None
+
 # Colors for output
 class Colors:
     RED = '\033[0;31m'
@@ -48,79 +57,73 @@ def get_versions_file_path() -> Path:
     script_dir = Path(__file__).parent
     return script_dir.parent / "versions.yml"
 
+# One "key: value" line of versions.yml; comment-only and blank lines never
+# match, and a trailing " # comment" is left out of the value. A quoted value
+# is matched whole first, so a " #" inside the quotes is kept
+_YAML_LINE_RE = re.compile(
+    r'^(?P<indent>[ \t]*)(?P<key>[^\s#:][^:\n]*?)[ \t]*:[ \t]*'
+    r'(?P<value>"[^"\n]*"|\'[^\'\n]*\'|.*?)(?:[ \t]+#.*)?[ \t\r]*$',
+    re.MULTILINE
+)
+
+def _unquote(value: str) -> str:
+    """Remove one pair of matching quotes around a value"""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+        return value[1:-1]
+    return value
+
 def simple_yaml_parser(content: str) -> Dict[str, Any]:
     """Simple YAML parser for our specific format"""
     result = {}
     current_section = None
     
-    for line in content.split('\n'):
-        original_line = line
-        line = line.strip()
+    for match in _YAML_LINE_RE.finditer(content):
+        indented = bool(match.group('indent'))
+        key = match.group('key')
+        value = match.group('value')
         
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
-            continue
-        
-        # Check for section headers (key: with no value on non-indented lines)
-        if line.endswith(':') and not original_line.startswith(' ') and not original_line.startswith('\t'):
-            current_section = line[:-1].strip()
-            result[current_section] = {}
-            continue
-        
-        # Check for key-value pairs
-        if ':' in line:
-            # Handle indented items (part of a section)
-            if original_line.startswith(' ') or original_line.startswith('\t'):
-                if current_section is None:
-                    continue
-                    
-                # Remove leading whitespace
-                line = line.lstrip()
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes from value
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                result[current_section][key] = value
-            else:
+        if not indented:
+            if value:
                 # Top-level key-value pair (not part of a section)
-                key, value = line.split(':', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes from value
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-                
-                result[key] = value
-                current_section = None  # Reset current section
+                result[key] = _unquote(value)
+                current_section = None
+            else:
+                # Section header (key: with no value on a non-indented line)
+                current_section = key
+                result[current_section] = {}
+        elif value and current_section is not None:
+            # Indented item (part of a section)
+            result[current_section][key] = _unquote(value)
     
     return result
 
 def load_versions_file() -> Dict[str, Any]:
-    """Load and parse the versions.yml file"""
+    """Load and parse the versions.yml file (cached until the file changes)"""
+    global _versions_cache
     versions_file = get_versions_file_path()
     
-    if not versions_file.exists():
+    try:
+        cache_key = (str(versions_file), versions_file.stat().st_mtime_ns)
+    except FileNotFoundError:
         log_error(f"versions.yml not found at {versions_file}")
         sys.exit(1)
     
+    if _versions_cache is not None and _versions_cache[0] == cache_key:
+        return _versions_cache[1]
+    
     try:
-        with open(versions_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
         if HAS_YAML:
-            return yaml.safe_load(content) or {}
+            # Hand the loader the raw byte stream; it detects the encoding
+            # itself, so there is no separate read and decode step
+            with open(versions_file, 'rb') as f:
+                versions = yaml.load(f, Loader=YamlLoader) or {}
         else:
             # Use simple parser
-            return simple_yaml_parser(content)
+            with open(versions_file, 'r', encoding='utf-8') as f:
+                versions = simple_yaml_parser(f.read())
+        
+        _versions_cache = (cache_key, versions)
+        return versions
             
     except Exception as e:
         log_error(f"Error parsing versions.yml: {e}")